@@ -0,0 +1,18 @@
+import pytest
+
+from autonomous_setup import AutonomousSetup, _REQUIREMENTS, _REQUIREMENTS_TXT
+
+
+def test_requirements_have_no_duplicates():
+    assert len(set(_REQUIREMENTS)) == len(_REQUIREMENTS)
+
+
+def test_requirements_txt_is_sorted():
+    lines = _REQUIREMENTS_TXT.decode('utf-8').split('\n')
+    assert lines == sorted(lines)
+    assert len(lines) == len(_REQUIREMENTS)
+
+
+def test_negative_simulate_delay_is_rejected():
+    with pytest.raises(ValueError):
+        AutonomousSetup(simulate_delay=-1)